@@ -24,6 +24,7 @@
  * 2025-10-30  完善控制台设置和用户交互（v1.2）
  * 2025-11-1   适配全局变量管理，优化资源清理（v2.0）
  * 2025-11-4   完善注释和代码结构（v2.1）
+ * 2026-10-15  启动时统一初始化随机数种子
  */
 
 #include "menu.h"
@@ -70,7 +71,7 @@ void setConsoleEncoding() {
  * @retval int 程序退出状态码
  * 
  * 功能说明：
- * 1. 设置控制台环境配置
+ * 1. 设置控制台环境配置并初始化随机数种子
  * 2. 显示系统启动画面和欢迎信息
  * 3. 初始化系统各个模块和数据结构
  * 4. 加载持久化数据到内存
@@ -98,6 +99,9 @@ int main() {
     // 设置控制台编码
     setConsoleEncoding();
 
+    // 初始化随机数种子（全程序只播种一次，供随机选号使用）
+    srand((unsigned int)time(NULL));
+
     // 显示系统启动画面
     showTitle();
 
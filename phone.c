@@ -26,6 +26,8 @@
  * 2025-10-29  实现完整的文件操作接口，支持数据持久化（v2.0）
  * 2025-11-1   适配全局变量管理(v2.1)
  * 2025-11-4   优化手机号初始化功能，复杂度由O(s * n^2)降低为O(s * n) （v2.2)
+ * 2026-10-15  手机号资源文件读写使用大块缓冲，减少逐条记录的系统调用
+ * 2026-10-15  随机数种子改为程序启动时统一初始化，不再每次选号重复播种
  */
 
 #include <stdio.h>
@@ -476,7 +478,6 @@ int selectRandomPhone(PhoneManager *manager, char *selectedPhone){
     }
 
     // 随机选择一个可用手机号
-    srand((unsigned int)time(NULL));                            // 初始化随机数种子
     int selectedIndex = availableIndices[rand() % availableCount];
     
     // 边界检查
@@ -884,7 +885,6 @@ int getAvailablePhones(PhoneManager* manager,
     }
 
     // 随机选择最多maxCount个手机号
-    srand((unsigned int)time(NULL));
     int selectedCount = 0;
 
     // 如果可用数量少于需求，调整实际选择数量
@@ -1008,7 +1008,6 @@ int getAvailablePhonesBySegment(PhoneManager *manager, const char *segment,
     }
 
     // 随机选择最多maxCount个手机号
-    srand((unsigned int)time(NULL));
     int selectedCount = 0;
 
     // 如果可用数量少于需求，调整实际选择数量
@@ -1245,7 +1244,7 @@ int getAvailablePhoneCountBySegment(PhoneManager *manager, const char *segment)
  * 
  * 实现细节：
  * - 验证输入参数的合法性
- * - 打开二进制文件进行写入
+ * - 打开二进制文件进行写入，并设置大块文件缓冲
  * - 写入文件头（版本信息和数据量）
  * - 写入所有手机号资源数据
  * - 验证写入数据的完整性
@@ -1259,6 +1258,7 @@ int savePhoneResource(const PhoneManager *manager, const char *fileName) {
     if (file == NULL) {
         return 0;
     }
+    setvbuf(file, NULL, _IOFBF, PHONE_FILE_BUFFER_SIZE);       // 整块缓冲，合并逐条记录的小块写入
     
     // 写入文件头：版本信息和数据量
     int version = 1;
@@ -1316,7 +1316,7 @@ int savePhoneResource(const PhoneManager *manager, const char *fileName) {
  * 
  * 实现细节：
  * - 验证输入参数的合法性
- * - 打开二进制文件进行读取
+ * - 打开二进制文件进行读取，并设置大块文件缓冲
  * - 读取文件头（版本信息和数据量）
  * - 检查版本兼容性
  * - 确保管理器有足够的容量
@@ -1332,6 +1332,7 @@ int loadPhoneResource(PhoneManager *manager, const char *fileName)
     if (file == NULL) {
         return 0;
     }
+    setvbuf(file, NULL, _IOFBF, PHONE_FILE_BUFFER_SIZE);       // 整块缓冲，合并逐条记录的小块读取
     
     // 读取文件头
     int version, count, capacity;
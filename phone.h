@@ -45,6 +45,7 @@
 #define MAX_PHONE_PER_USER 5            // 每用户最大绑定手机号数量
 #define INIT_PHONE_CAPACITY 100         // 初始手机号池容量
 #define PHONES_PER_SEGMENT 99999        // 每个号段的手机号数量（可调整）
+#define PHONE_FILE_BUFFER_SIZE 65536    // 手机号资源文件读写缓冲区大小（字节）
 
 // ========== 数据类型定义 ==========
 